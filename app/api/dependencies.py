@@ -0,0 +1,104 @@
+from collections.abc import Callable
+
+from fastapi import Path, Request
+
+from app.core.config import TENANT_ID_PATTERN, Settings
+from app.core.exceptions.todo_exceptions import TodoValidationError
+from app.services.tenant import get_tenant_registry
+from app.services.todo import TodoService, get_todo_service
+
+# Returns the TodoService that should handle a request. The flag is True for
+# requests that create todos, so that reads never allocate tenant partitions.
+TodoServiceResolver = Callable[[Request, bool], TodoService]
+
+
+def get_tenant_id(request: Request, header: str, default_tenant: str) -> str:
+    """
+    Get the tenant a request belongs to.
+
+    The tenant is taken from the ``tenant_id`` path parameter, then from the
+    tenant header, and falls back to the default tenant.
+
+    Args:
+        request: The incoming request
+        header: Name of the header carrying the tenant ID
+        default_tenant: Tenant used when the request names none
+
+    Returns:
+        str: The ID of the tenant
+
+    Raises:
+        TodoValidationError: If the tenant ID is not valid
+    """
+    tenant_id = (
+        request.path_params.get("tenant_id")
+        or request.headers.get(header)
+        or default_tenant
+    )
+    if not TENANT_ID_PATTERN.match(tenant_id):
+        raise TodoValidationError(
+            "Tenant ID must be 1-64 letters, digits, underscores or hyphens"
+        )
+    return tenant_id
+
+
+def create_todo_service_resolver(settings: Settings) -> TodoServiceResolver:
+    """
+    Choose how requests are mapped to a TodoService when the app is built.
+
+    Args:
+        settings: The settings the application is built with
+
+    Returns:
+        TodoServiceResolver: The global service, or the request's tenant partition
+    """
+    if not settings.MULTI_TENANT:
+        todo_service = get_todo_service()
+        return lambda request, create: todo_service
+
+    registry = get_tenant_registry()
+    header = settings.TENANT_HEADER
+    default_tenant = settings.DEFAULT_TENANT
+
+    def resolve(request: Request, create: bool) -> TodoService:
+        tenant_id = get_tenant_id(request, header, default_tenant)
+        return registry.get_service(tenant_id, create=create)
+
+    return resolve
+
+
+async def get_request_todo_service(request: Request) -> TodoService:
+    """
+    Get the TodoService that should handle a read, update or delete.
+
+    This is async so that FastAPI resolves it on the event loop rather than in
+    its threadpool.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        TodoService: The tenant's TodoService, or the global one
+    """
+    resolver: TodoServiceResolver = request.app.state.todo_service_resolver
+    return resolver(request, False)
+
+
+async def get_request_todo_service_for_write(request: Request) -> TodoService:
+    """
+    Get the TodoService that should store a new todo.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        TodoService: The tenant's TodoService, created if needed, or the global one
+    """
+    resolver: TodoServiceResolver = request.app.state.todo_service_resolver
+    return resolver(request, True)
+
+
+def tenant_path(
+    tenant_id: str = Path(..., description="ID of the tenant owning the todos")
+) -> None:
+    """Declare the ``tenant_id`` path prefix parameter in the OpenAPI schema."""
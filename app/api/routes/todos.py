@@ -1,16 +1,35 @@
-from fastapi import APIRouter, Depends, status
-
-from app.models.todo import TodoCreate, TodoResponse
-from app.services.todo import TodoService, get_todo_service
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+
+from app.api.dependencies import (
+    TodoServiceResolver,
+    get_request_todo_service,
+    get_request_todo_service_for_write,
+)
+from app.models.todo import (
+    TodoCreate,
+    TodoResponse,
+    todo_response_adapter,
+    todo_response_list_adapter,
+)
+from app.services.todo import TodoService
 
 # We no longer need to import HTTPException as we're using custom exceptions
 
+# Lists longer than this are encoded and sent this many todos at a time, yielding
+# to the event loop in between, so one large list cannot stall other requests
+LIST_CHUNK_SIZE = 500
+
 router = APIRouter(prefix="/todos", tags=["todos"])
 
 
 @router.get("/{todo_id}", response_model=TodoResponse)
 async def get_todo(
-    todo_id: str, todo_service: TodoService = Depends(get_todo_service)
+    todo_id: str, todo_service: TodoService = Depends(get_request_todo_service)
 ) -> TodoResponse:
     """
     Get a todo by ID.
@@ -30,8 +49,8 @@ async def get_todo(
 
 @router.get("/", response_model=list[TodoResponse])
 async def get_todos(
-    todo_service: TodoService = Depends(get_todo_service),
-) -> list[TodoResponse]:
+    todo_service: TodoService = Depends(get_request_todo_service),
+) -> list[TodoResponse] | Response:
     """
     Get all todos.
 
@@ -41,12 +60,16 @@ async def get_todos(
     Returns:
         list[TodoResponse]: List of all todos
     """
-    return todo_service.get_todos()
+    todos = todo_service.get_todos()
+    if len(todos) > LIST_CHUNK_SIZE:
+        return _streaming_todo_list_response(todos)
+    return todos
 
 
 @router.post("/", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
 async def create_todo(
-    todo_in: TodoCreate, todo_service: TodoService = Depends(get_todo_service)
+    todo_in: TodoCreate,
+    todo_service: TodoService = Depends(get_request_todo_service_for_write),
 ) -> TodoResponse:
     """
     Create a new todo.
@@ -65,7 +88,7 @@ async def create_todo(
 async def update_todo(
     todo_id: str,
     todo_in: TodoCreate,
-    todo_service: TodoService = Depends(get_todo_service),
+    todo_service: TodoService = Depends(get_request_todo_service),
 ) -> TodoResponse:
     """
     Update a todo.
@@ -86,7 +109,7 @@ async def update_todo(
 
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_todo(
-    todo_id: str, todo_service: TodoService = Depends(get_todo_service)
+    todo_id: str, todo_service: TodoService = Depends(get_request_todo_service)
 ) -> None:
     """
     Delete a todo.
@@ -99,3 +122,119 @@ async def delete_todo(
         TodoNotFoundError: If the todo is not found
     """
     todo_service.delete_todo(todo_id)
+
+
+def _json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """Wrap already-encoded JSON in a response, bypassing response_model handling."""
+    return Response(
+        content=content, status_code=status_code, media_type="application/json"
+    )
+
+
+async def _encode_todo_list(todos: list[TodoResponse]) -> AsyncIterator[bytes]:
+    """Encode a JSON array of todos chunk by chunk, yielding to the event loop."""
+    for start in range(0, len(todos), LIST_CHUNK_SIZE):
+        chunk = todo_response_list_adapter.dump_json(
+            todos[start : start + LIST_CHUNK_SIZE]
+        )
+        # Splice the chunks' arrays into one, e.g. b"[{..},{..}" + b",{..}" + b"]"
+        yield (b"[" if start == 0 else b",") + chunk[1:-1]
+        await asyncio.sleep(0)
+    yield b"]"
+
+
+def _streaming_todo_list_response(todos: list[TodoResponse]) -> Response:
+    """Stream a large list of todos with the same bytes as a single response."""
+    return StreamingResponse(_encode_todo_list(todos), media_type="application/json")
+
+
+def _todo_list_response(todos: list[TodoResponse]) -> Response:
+    """Encode a list of todos, streaming it if it is large."""
+    if len(todos) > LIST_CHUNK_SIZE:
+        return _streaming_todo_list_response(todos)
+    return _json_response(todo_response_list_adapter.dump_json(todos))
+
+
+def create_fast_router(resolve_service: TodoServiceResolver) -> APIRouter:
+    """
+    Create a router serving the todo routes through a fast path.
+
+    The service is looked up with a resolver chosen once at startup instead of
+    through ``Depends`` on every request, and handlers return pre-encoded
+    responses so FastAPI skips re-validating and re-encoding the response model.
+    Routes are declared with the same paths, names, response models and
+    descriptions as ``router``, so the OpenAPI schema and response bodies are
+    identical. Dependency overrides for ``get_request_todo_service`` do not apply
+    to this router.
+
+    Args:
+        resolve_service: Returns the todo service that should handle a request
+
+    Returns:
+        APIRouter: Router with the fast-path todo routes
+    """
+    fast_router = APIRouter(prefix="/todos", tags=["todos"])
+    descriptions = {
+        route.name: route.description
+        for route in router.routes
+        if isinstance(route, APIRoute)
+    }
+
+    @fast_router.get(
+        "/{todo_id}",
+        response_model=TodoResponse,
+        description=descriptions["get_todo"],
+    )
+    async def get_todo(request: Request, todo_id: str) -> Response:
+        return _json_response(
+            todo_response_adapter.dump_json(
+                resolve_service(request, False).get_todo(todo_id)
+            )
+        )
+
+    @fast_router.get(
+        "/",
+        response_model=list[TodoResponse],
+        description=descriptions["get_todos"],
+    )
+    async def get_todos(request: Request) -> Response:
+        return _todo_list_response(resolve_service(request, False).get_todos())
+
+    @fast_router.post(
+        "/",
+        response_model=TodoResponse,
+        status_code=status.HTTP_201_CREATED,
+        description=descriptions["create_todo"],
+    )
+    async def create_todo(request: Request, todo_in: TodoCreate) -> Response:
+        return _json_response(
+            todo_response_adapter.dump_json(
+                resolve_service(request, True).create_todo(todo_in)
+            ),
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    @fast_router.put(
+        "/{todo_id}",
+        response_model=TodoResponse,
+        description=descriptions["update_todo"],
+    )
+    async def update_todo(
+        request: Request, todo_id: str, todo_in: TodoCreate
+    ) -> Response:
+        return _json_response(
+            todo_response_adapter.dump_json(
+                resolve_service(request, False).update_todo(todo_id, todo_in)
+            )
+        )
+
+    @fast_router.delete(
+        "/{todo_id}",
+        status_code=status.HTTP_204_NO_CONTENT,
+        description=descriptions["delete_todo"],
+    )
+    async def delete_todo(request: Request, todo_id: str) -> Response:
+        resolve_service(request, False).delete_todo(todo_id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    return fast_router
@@ -1,6 +1,12 @@
+import re
+from functools import lru_cache
+from typing import Any
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+TENANT_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
 
 class Settings(BaseSettings):
     """
@@ -25,6 +31,31 @@ class Settings(BaseSettings):
     ENV: str = "development"
     DEBUG: bool = True
 
+    # Startup configuration
+    # Path to an OpenAPI schema exported at build time. When set and the file
+    # exists, the schema is served from it instead of being generated lazily.
+    OPENAPI_SCHEMA_PATH: str | None = None
+
+    # Performance configuration
+    # Serve the todo routes through a fast path that resolves the service once
+    # and encodes responses directly, skipping response_model re-validation
+    TODO_FAST_PATH: bool = False
+
+    # Multi-tenant configuration
+    # Partition todos per tenant, taken from the /tenants/{tenant_id} path prefix
+    # or the TENANT_HEADER header, falling back to DEFAULT_TENANT
+    MULTI_TENANT: bool = False
+    TENANT_HEADER: str = "X-Tenant-ID"
+    DEFAULT_TENANT: str = "default"
+    TENANT_MAX_ITEMS: int | None = None
+    TENANT_MAX_BYTES: int | None = None
+    # Empty partitions idle for longer than this are dropped from memory; new
+    # tenants beyond TENANT_MAX_PARTITIONS are rejected
+    TENANT_IDLE_SECONDS: float | None = None
+    TENANT_MAX_PARTITIONS: int | None = None
+    # Also evict idle partitions that hold todos, discarding them with a warning
+    TENANT_EVICT_NONEMPTY: bool = False
+
     @field_validator("ENV")
     @classmethod
     def validate_environment(cls, v: str) -> str:
@@ -34,5 +65,30 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of {allowed_environments}")
         return v
 
+    @field_validator("DEFAULT_TENANT")
+    @classmethod
+    def validate_default_tenant(cls, v: str) -> str:
+        """Validate that the default tenant is a valid tenant ID."""
+        if not TENANT_ID_PATTERN.match(v):
+            raise ValueError(
+                "Tenant ID must be 1-64 letters, digits, underscores or hyphens"
+            )
+        return v
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    Returns:
+        Settings: The cached Settings instance
+    """
+    return Settings()
+
 
-settings = Settings()
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``settings`` lazily for backwards compatibility."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,11 @@
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 
-from app.core.exceptions.todo_exceptions import TodoNotFoundError, TodoValidationError
+from app.core.exceptions.todo_exceptions import (
+    TodoNotFoundError,
+    TodoQuotaExceededError,
+    TodoValidationError,
+)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -44,3 +48,22 @@ def register_exception_handlers(app: FastAPI) -> None:
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={"detail": exc.message},
         )
+
+    @app.exception_handler(TodoQuotaExceededError)
+    async def todo_quota_exceeded_handler(
+        request: Request, exc: TodoQuotaExceededError
+    ) -> JSONResponse:
+        """
+        Handle TodoQuotaExceededError exceptions.
+
+        Args:
+            request: The request that caused the exception
+            exc: The exception instance
+
+        Returns:
+            JSONResponse: A JSON response with a 429 status code
+        """
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": exc.message},
+        )
@@ -19,3 +19,11 @@ class TodoValidationError(TodoException):
     def __init__(self, message: str) -> None:
         self.message = message
         super().__init__(self.message)
+
+
+class TodoQuotaExceededError(TodoException):
+    """Exception raised when a write would exceed a todo store's quota."""
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+        super().__init__(self.message)
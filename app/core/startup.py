@@ -0,0 +1,199 @@
+"""
+Startup tooling for the FastAPI application.
+
+Exports the OpenAPI schema at build time and reports how long the application
+takes to become ready. Run with ``python -m app.core.startup --help``.
+"""
+
+import asyncio
+import importlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Any, Optional
+
+import typer
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+cli = typer.Typer(add_completion=False)
+
+
+@dataclass
+class StartupReport:
+    """Time-to-ready of the application, broken down by phase, in seconds."""
+
+    import_seconds: float
+    settings_seconds: float
+    factory_seconds: float
+    first_request_seconds: float
+
+    @property
+    def total_seconds(self) -> float:
+        """Total time from the first import to the first response."""
+        return (
+            self.import_seconds
+            + self.settings_seconds
+            + self.factory_seconds
+            + self.first_request_seconds
+        )
+
+
+async def _request(application: "FastAPI", path: str) -> int:
+    """
+    Send a GET request straight through the ASGI application.
+
+    Args:
+        application: The application to call
+        path: The path to request
+
+    Returns:
+        int: The response status code
+    """
+    status_code = 0
+
+    async def receive() -> MutableMapping[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"startup")],
+        "client": ("127.0.0.1", 0),
+        "server": ("startup", 80),
+    }
+    await application(scope, receive, send)
+    return status_code
+
+
+def measure_startup() -> StartupReport:
+    """
+    Measure each phase of application startup in the current process.
+
+    The import phase is only meaningful in a fresh interpreter, since modules
+    that are already loaded are not imported again.
+
+    Returns:
+        StartupReport: The time spent in each phase
+    """
+    start = time.perf_counter()
+    main = importlib.import_module("app.main")
+    imported = time.perf_counter()
+
+    settings = main.get_settings()
+    settings_loaded = time.perf_counter()
+
+    application = main.create_application()
+    created = time.perf_counter()
+
+    # Call the ASGI app directly so no test client or event loop setup is timed
+    loop = asyncio.new_event_loop()
+    try:
+        request_start = time.perf_counter()
+        status_code = loop.run_until_complete(
+            _request(application, f"{settings.API_PREFIX}/openapi.json")
+        )
+        request_end = time.perf_counter()
+    finally:
+        loop.close()
+    if status_code != 200:
+        raise RuntimeError(f"First request failed with status {status_code}")
+
+    return StartupReport(
+        import_seconds=imported - start,
+        settings_seconds=settings_loaded - imported,
+        factory_seconds=created - settings_loaded,
+        first_request_seconds=request_end - request_start,
+    )
+
+
+def export_openapi_schema(path: Path) -> None:
+    """
+    Generate the OpenAPI schema and write it to a file.
+
+    The schema is stamped with a fingerprint of the routes and settings it was
+    generated from, so that it is only served by a matching application.
+
+    Args:
+        path: Where to write the schema
+    """
+    from fastapi import FastAPI
+
+    from app.core.config import get_settings
+    from app.main import (
+        OPENAPI_FINGERPRINT_KEY,
+        create_application,
+        openapi_fingerprint,
+    )
+
+    application = create_application()
+    # Call the generator directly, since application.openapi may serve a
+    # previously exported schema
+    schema = {
+        **FastAPI.openapi(application),
+        OPENAPI_FINGERPRINT_KEY: openapi_fingerprint(application, get_settings()),
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(schema, indent=2) + "\n", encoding="utf-8")
+
+
+@cli.command()
+def main(
+    export_openapi: Optional[Path] = typer.Option(
+        None, help="Write the generated OpenAPI schema to this path and exit."
+    ),
+    startup_report: bool = typer.Option(
+        False, "--startup-report", help="Print a breakdown of time-to-ready."
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="Print the startup report as JSON."
+    ),
+) -> None:
+    """Build-time and startup tooling for the application."""
+    if export_openapi is not None:
+        export_openapi_schema(export_openapi)
+        typer.echo(f"OpenAPI schema written to {export_openapi}")
+        return
+
+    if not startup_report:
+        raise typer.BadParameter("Pass --export-openapi or --startup-report")
+
+    report = measure_startup()
+    if as_json:
+        typer.echo(
+            json.dumps({**asdict(report), "total_seconds": report.total_seconds})
+        )
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Startup report")
+    table.add_column("Phase")
+    table.add_column("Time (ms)", justify="right")
+    table.add_row("Import", f"{report.import_seconds * 1000:.1f}")
+    table.add_row("Settings load", f"{report.settings_seconds * 1000:.1f}")
+    table.add_row("App factory", f"{report.factory_seconds * 1000:.1f}")
+    table.add_row("First request", f"{report.first_request_seconds * 1000:.1f}")
+    table.add_row("Total", f"{report.total_seconds * 1000:.1f}", style="bold")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    cli()
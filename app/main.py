@@ -1,9 +1,99 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
 
-from app.api.routes import todos
-from app.core.config import settings
-from app.core.exceptions.handlers import register_exception_handlers
+import pydantic
+from fastapi import Depends, FastAPI
+from fastapi import __version__ as fastapi_version
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Sources whose changes can alter the schema, e.g. models, routes and docstrings
+APP_DIR = Path(__file__).resolve().parent
+
+# Key under which an exported schema records what it was generated from
+OPENAPI_FINGERPRINT_KEY = "x-route-fingerprint"
+
+# Settings that change the generated OpenAPI schema
+OPENAPI_SETTINGS = (
+    "PROJECT_NAME",
+    "PROJECT_DESCRIPTION",
+    "VERSION",
+    "API_PREFIX",
+    "TODO_FAST_PATH",
+    "MULTI_TENANT",
+)
+
+
+def openapi_fingerprint(application: FastAPI, settings: Settings) -> str:
+    """
+    Fingerprint everything the OpenAPI schema is generated from.
+
+    This covers the route table, the settings that shape the schema, the
+    FastAPI and Pydantic versions, and the application sources, so changes to
+    models, field constraints, status codes or descriptions are detected.
+
+    Args:
+        application: The application whose routes to fingerprint
+        settings: The settings the application was built with
+
+    Returns:
+        str: A hex digest that changes whenever the schema could change
+    """
+    routes = sorted(
+        (
+            getattr(route, "path", ""),
+            sorted(getattr(route, "methods", None) or ()),
+            getattr(route, "name", ""),
+        )
+        for route in application.routes
+    )
+    values = {name: getattr(settings, name) for name in OPENAPI_SETTINGS}
+    payload = json.dumps(
+        [routes, values, fastapi_version, pydantic.VERSION],
+        sort_keys=True,
+        default=str,
+    )
+
+    digest = hashlib.sha256(payload.encode("utf-8"))
+    for source in sorted(APP_DIR.rglob("*.py")):
+        digest.update(source.relative_to(APP_DIR).as_posix().encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def load_openapi_schema(path: str, fingerprint: str) -> dict[str, Any] | None:
+    """
+    Load an OpenAPI schema exported at build time.
+
+    Args:
+        path: Path to the exported schema file
+        fingerprint: Fingerprint of the application the schema must match
+
+    Returns:
+        dict[str, Any] | None: The schema, or None if the file is missing or stale
+    """
+    schema_file = Path(path)
+    if not schema_file.is_file():
+        logger.warning("OpenAPI schema file %s not found; generating lazily", path)
+        return None
+
+    with schema_file.open(encoding="utf-8") as f:
+        schema: dict[str, Any] = json.load(f)
+
+    # Never serve a schema exported from different routes, settings or sources
+    if schema.pop(OPENAPI_FINGERPRINT_KEY, None) != fingerprint:
+        logger.warning(
+            "OpenAPI schema file %s does not match the application; "
+            "generating lazily",
+            path,
+        )
+        return None
+    return schema
 
 
 def create_application() -> FastAPI:
@@ -13,6 +103,16 @@ def create_application() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance
     """
+    # Deferred so that importing this module stays cheap; these are only
+    # needed once an application is actually built
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from app.api.dependencies import create_todo_service_resolver, tenant_path
+    from app.api.routes import todos
+    from app.core.exceptions.handlers import register_exception_handlers
+
+    settings = get_settings()
+
     application = FastAPI(
         title=settings.PROJECT_NAME,
         description=settings.PROJECT_DESCRIPTION,
@@ -31,13 +131,46 @@ def create_application() -> FastAPI:
         allow_headers=["*"],  # Allows all headers
     )
 
+    # Choose the global store or per-tenant partitions once, at build time
+    resolver = create_todo_service_resolver(settings)
+    application.state.todo_service_resolver = resolver
+
     # Include routers
-    application.include_router(todos.router, prefix=settings.API_PREFIX)
+    if settings.TODO_FAST_PATH:
+        todo_router = todos.create_fast_router(resolver)
+    else:
+        todo_router = todos.router
+    application.include_router(todo_router, prefix=settings.API_PREFIX)
+    if settings.MULTI_TENANT:
+        application.include_router(
+            todo_router,
+            prefix=f"{settings.API_PREFIX}/tenants/{{tenant_id}}",
+            dependencies=[Depends(tenant_path)],
+        )
 
     # Register exception handlers
     register_exception_handlers(application)
 
+    # Serve the build-time OpenAPI schema instead of generating it on first hit
+    if settings.OPENAPI_SCHEMA_PATH:
+        schema = load_openapi_schema(
+            settings.OPENAPI_SCHEMA_PATH, openapi_fingerprint(application, settings)
+        )
+        if schema is not None:
+            application.openapi = lambda: schema  # type: ignore[method-assign]
+
     return application
 
 
-app = create_application()
+def __getattr__(name: str) -> Any:
+    """
+    Create the module-level ``app`` on first access.
+
+    ``uvicorn app.main:app`` and ``from app.main import app`` both resolve the
+    attribute through here, so the application is only built when it is used.
+    """
+    if name == "app":
+        application = create_application()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class TodoBase(BaseModel):
@@ -29,3 +29,8 @@ class TodoResponse(TodoBase):
     """
 
     id: str = Field(..., description="Unique identifier for the todo item")
+
+
+# Precompiled serializers for TodoResponse instances that are already validated
+todo_response_adapter = TypeAdapter(TodoResponse)
+todo_response_list_adapter = TypeAdapter(list[TodoResponse])
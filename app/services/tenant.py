@@ -0,0 +1,170 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Dict
+
+from app.core.config import get_settings
+from app.core.exceptions.todo_exceptions import TodoQuotaExceededError
+from app.services.todo import TodoService
+
+logger = logging.getLogger(__name__)
+
+# Stands in for tenants without a partition. It holds no todos and its zero item
+# quota rejects any attempt to store one.
+EMPTY_TODO_SERVICE = TodoService(max_items=0)
+
+
+class TenantRegistry:
+    """
+    Registry of per-tenant TodoService partitions.
+
+    Each tenant gets an isolated TodoService with its own storage, counters and
+    quotas. Partitions are kept in least recently used order so that idle
+    partitions can be evicted from memory. Since storage is in memory, only
+    empty partitions are evicted unless ``evict_nonempty`` is set, in which case
+    the discarded todos are logged. Once the maximum number of partitions is
+    reached, new tenants are rejected rather than evicting active ones.
+
+    The registry is safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        max_items: int | None = None,
+        max_bytes: int | None = None,
+        idle_seconds: float | None = None,
+        max_partitions: int | None = None,
+        evict_nonempty: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            max_items: Maximum number of todos per tenant, or None for no limit
+            max_bytes: Maximum total todo size per tenant, or None for no limit
+            idle_seconds: Evict partitions idle for longer than this, or None
+            max_partitions: Maximum number of partitions kept in memory, or None
+            evict_nonempty: Whether idle partitions holding todos are evicted too
+            clock: Monotonic clock used to track partition access times
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds
+        self.max_partitions = max_partitions
+        self.evict_nonempty = evict_nonempty
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.partitions: OrderedDict[str, TodoService] = OrderedDict()
+        self._last_access: Dict[str, float] = {}
+
+    def get_service(self, tenant_id: str, create: bool = True) -> TodoService:
+        """
+        Get the TodoService for a tenant.
+
+        Only writes should create partitions, so that reads for arbitrary tenant
+        IDs cannot grow memory or use up partition slots.
+
+        Args:
+            tenant_id: The ID of the tenant
+            create: Whether to create the partition if it does not exist
+
+        Returns:
+            TodoService: The tenant's TodoService, or an empty read-only service
+                for an unknown tenant when ``create`` is False
+
+        Raises:
+            TodoQuotaExceededError: If a new partition would exceed the maximum
+        """
+        with self._lock:
+            now = self._clock()
+            self._evict_idle(now)
+
+            service = self.partitions.get(tenant_id)
+            if service is None:
+                if not create:
+                    return EMPTY_TODO_SERVICE
+                if (
+                    self.max_partitions is not None
+                    and len(self.partitions) >= self.max_partitions
+                ):
+                    raise TodoQuotaExceededError(
+                        f"Tenant quota exceeded: at most {self.max_partitions} "
+                        "active tenants"
+                    )
+                service = TodoService(
+                    max_items=self.max_items, max_bytes=self.max_bytes
+                )
+                self.partitions[tenant_id] = service
+            else:
+                self.partitions.move_to_end(tenant_id)
+            self._last_access[tenant_id] = now
+            return service
+
+    def evict(self, tenant_id: str) -> None:
+        """
+        Drop a tenant's partition from memory.
+
+        Args:
+            tenant_id: The ID of the tenant to evict
+        """
+        with self._lock:
+            self._evict(tenant_id)
+
+    def _evict(self, tenant_id: str) -> None:
+        """Drop a tenant's partition; the caller must hold the lock."""
+        self.partitions.pop(tenant_id, None)
+        self._last_access.pop(tenant_id, None)
+
+    def _evict_idle(self, now: float) -> None:
+        """Evict partitions idle for too long; the caller must hold the lock."""
+        if self.idle_seconds is None:
+            return
+        # Partitions are in least recently used order, so stop at the first one
+        # that is still active
+        while self.partitions:
+            tenant_id, service = next(iter(self.partitions.items()))
+            if now - self._last_access[tenant_id] <= self.idle_seconds:
+                break
+            if service.todos and not self.evict_nonempty:
+                # Keep partitions holding todos, and check them again only
+                # after another idle period so the scan stays short
+                self.partitions.move_to_end(tenant_id)
+                self._last_access[tenant_id] = now
+                continue
+            if service.todos:
+                logger.warning(
+                    "Evicting idle tenant %s, discarding %d todos",
+                    tenant_id,
+                    len(service.todos),
+                )
+            self._evict(tenant_id)
+
+
+# Singleton instance of TenantRegistry
+_tenant_registry: TenantRegistry | None = None
+_tenant_registry_lock = threading.Lock()
+
+
+def get_tenant_registry() -> TenantRegistry:
+    """
+    Get or create the TenantRegistry singleton.
+
+    Returns:
+        TenantRegistry: The TenantRegistry instance, configured from settings
+    """
+    global _tenant_registry
+    if _tenant_registry is None:
+        with _tenant_registry_lock:
+            if _tenant_registry is None:
+                settings = get_settings()
+                _tenant_registry = TenantRegistry(
+                    max_items=settings.TENANT_MAX_ITEMS,
+                    max_bytes=settings.TENANT_MAX_BYTES,
+                    idle_seconds=settings.TENANT_IDLE_SECONDS,
+                    max_partitions=settings.TENANT_MAX_PARTITIONS,
+                    evict_nonempty=settings.TENANT_EVICT_NONEMPTY,
+                )
+    return _tenant_registry
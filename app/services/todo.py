@@ -1,18 +1,70 @@
 import uuid
 from typing import Dict, List
 
-from app.core.exceptions.todo_exceptions import TodoNotFoundError
-from app.models.todo import TodoCreate, TodoResponse
+from app.core.exceptions.todo_exceptions import (
+    TodoNotFoundError,
+    TodoQuotaExceededError,
+)
+from app.models.todo import TodoCreate, TodoResponse, todo_response_adapter
 
 
 class TodoService:
     """
     Service for managing Todo items with in-memory storage.
+
+    Optionally enforces quotas on the number of stored todos and on their total
+    size in bytes, measured as the size of their UTF-8 JSON encoding. The byte
+    counter is only maintained when a byte quota is set.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty in-memory storage for todos."""
+    def __init__(
+        self, max_items: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """
+        Initialize an empty in-memory storage for todos.
+
+        Args:
+            max_items: Maximum number of todos to store, or None for no limit
+            max_bytes: Maximum total size of stored todos, or None for no limit
+        """
         self.todos: Dict[str, TodoResponse] = {}
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.byte_count = 0
+        self._sizes: Dict[str, int] = {}
+
+    def _reserve(self, todo: TodoResponse, replaced_size: int | None = None) -> int:
+        """
+        Check that storing a todo stays within the quotas.
+
+        Args:
+            todo: The todo about to be stored
+            replaced_size: Size of the todo it replaces, or None for a new todo
+
+        Returns:
+            int: The size of the todo in bytes, or 0 if sizes are not tracked
+
+        Raises:
+            TodoQuotaExceededError: If storing the todo would exceed a quota
+        """
+        if (
+            self.max_items is not None
+            and replaced_size is None
+            and len(self.todos) >= self.max_items
+        ):
+            raise TodoQuotaExceededError(
+                f"Todo quota exceeded: at most {self.max_items} items"
+            )
+
+        if self.max_bytes is None:
+            return 0
+
+        size = len(todo_response_adapter.dump_json(todo))
+        if self.byte_count - (replaced_size or 0) + size > self.max_bytes:
+            raise TodoQuotaExceededError(
+                f"Todo quota exceeded: at most {self.max_bytes} bytes"
+            )
+        return size
 
     def create_todo(self, todo_in: TodoCreate) -> TodoResponse:
         """
@@ -23,10 +75,16 @@ class TodoService:
 
         Returns:
             TodoResponse: The created todo
+
+        Raises:
+            TodoQuotaExceededError: If the todo would exceed a quota
         """
         todo_id = str(uuid.uuid4())
         todo = TodoResponse(id=todo_id, **todo_in.model_dump())
+        size = self._reserve(todo)
         self.todos[todo_id] = todo
+        self._sizes[todo_id] = size
+        self.byte_count += size
         return todo
 
     def get_todo(self, todo_id: str) -> TodoResponse:
@@ -69,12 +127,17 @@ class TodoService:
 
         Raises:
             TodoNotFoundError: If the todo is not found
+            TodoQuotaExceededError: If the updated todo would exceed a quota
         """
         if todo_id not in self.todos:
             raise TodoNotFoundError(todo_id)
 
         todo = TodoResponse(id=todo_id, **todo_in.model_dump())
+        old_size = self._sizes[todo_id]
+        size = self._reserve(todo, replaced_size=old_size)
         self.todos[todo_id] = todo
+        self._sizes[todo_id] = size
+        self.byte_count += size - old_size
         return todo
 
     def delete_todo(self, todo_id: str) -> None:
@@ -91,6 +154,7 @@ class TodoService:
             raise TodoNotFoundError(todo_id)
 
         del self.todos[todo_id]
+        self.byte_count -= self._sizes.pop(todo_id)
 
 
 # Singleton instance of TodoService
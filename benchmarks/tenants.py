@@ -0,0 +1,150 @@
+"""
+Benchmark cold-tenant latency while one tenant is hot.
+
+Many small tenants send requests concurrently, with popularity following a Zipf
+distribution, while the hottest tenant, which owns a large todo list,
+repeatedly lists it on the same application. Cold-tenant latency percentiles
+are reported with and without that hot load, for a single global store and for
+per-tenant partitions. Latencies include time spent waiting for other requests
+on the event loop. Run with ``python -m benchmarks.tenants``.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+
+import typer
+from fastapi import FastAPI
+
+from app.models.todo import TodoCreate
+from app.services import tenant, todo
+from app.services.todo import TodoService
+from benchmarks.utils import build_app, call
+
+cli = typer.Typer(add_completion=False)
+
+HOT_TENANT = "tenant-0"
+
+
+def build_fresh_app(multi_tenant: bool) -> FastAPI:
+    """Create the application with fresh stores and multi-tenancy on or off."""
+    todo._todo_service = None
+    tenant._tenant_registry = None
+    return build_app(MULTI_TENANT=str(multi_tenant))
+
+
+def populate(service: TodoService, items: int) -> str:
+    """Add todos to a store and return the ID of the last one."""
+    todo_in = TodoCreate(title="Benchmark", description="x" * 100)
+    todo_id = ""
+    for _ in range(items):
+        todo_id = service.create_todo(todo_in).id
+    return todo_id
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return a percentile of the samples in microseconds."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1_000_000
+
+
+async def run_mode(
+    multi_tenant: bool,
+    hot_load: bool,
+    tenants: int,
+    hot_items: int,
+    requests: int,
+    concurrency: int,
+    seed: int,
+) -> tuple[list[float], int]:
+    """
+    Replay the cold-tenant workload, optionally with the hot tenant listing.
+
+    Returns:
+        tuple[list[float], int]: Cold-tenant latencies and hot list calls made
+    """
+    app = build_fresh_app(multi_tenant)
+    tenant_ids = [f"tenant-{i}" for i in range(tenants)]
+    todo_ids: dict[str, str] = {}
+    for tenant_id in tenant_ids:
+        if multi_tenant:
+            service = tenant.get_tenant_registry().get_service(tenant_id)
+        else:
+            service = todo.get_todo_service()
+        items = hot_items if tenant_id == HOT_TENANT else 10
+        todo_ids[tenant_id] = populate(service, items)
+
+    # Cold tenants only fetch their own todos by ID, so every request does the
+    # same work in both modes and only contention differs
+    rng = random.Random(seed)
+    cold_ids = tenant_ids[1:]
+    weights = [1 / (i + 1) ** 1.2 for i in range(len(cold_ids))]
+    workload = rng.choices(cold_ids, weights, k=requests)
+
+    latencies: list[float] = []
+    done = asyncio.Event()
+    hot_calls = 0
+
+    async def cold_worker(assigned: list[str]) -> None:
+        for tenant_id in assigned:
+            headers = [(b"x-tenant-id", tenant_id.encode())]
+            start = time.perf_counter()
+            await call(app, "GET", f"/api/todos/{todo_ids[tenant_id]}", headers=headers)
+            latencies.append(time.perf_counter() - start)
+
+    async def hot_worker() -> None:
+        nonlocal hot_calls
+        headers = [(b"x-tenant-id", HOT_TENANT.encode())]
+        while not done.is_set():
+            await call(app, "GET", "/api/todos/", headers=headers)
+            hot_calls += 1
+
+    hot_task = asyncio.create_task(hot_worker()) if hot_load else None
+    await asyncio.gather(
+        *(cold_worker(workload[i::concurrency]) for i in range(concurrency))
+    )
+    done.set()
+    if hot_task is not None:
+        await hot_task
+    return latencies, hot_calls
+
+
+@cli.command()
+def main(
+    tenants: int = typer.Option(200, help="Number of tenants."),
+    hot_items: int = typer.Option(20000, help="Todos owned by the hot tenant."),
+    requests: int = typer.Option(5000, help="Cold-tenant requests per run."),
+    concurrency: int = typer.Option(16, help="Concurrent cold-tenant clients."),
+    seed: int = typer.Option(0, help="Seed for the request mix."),
+) -> None:
+    """Compare cold-tenant latency with a global store and with partitions."""
+    typer.echo(
+        f"{'mode':<14}{'hot load':<10}{'p50 us':>10}{'p99 us':>12}"
+        f"{'mean us':>12}{'hot lists':>11}"
+    )
+    for multi_tenant in (False, True):
+        for hot_load in (False, True):
+            latencies, hot_calls = asyncio.run(
+                run_mode(
+                    multi_tenant,
+                    hot_load,
+                    tenants,
+                    hot_items,
+                    requests,
+                    concurrency,
+                    seed,
+                )
+            )
+            mode = "partitioned" if multi_tenant else "global"
+            typer.echo(
+                f"{mode:<14}{'on' if hot_load else 'off':<10}"
+                f"{percentile(latencies, 0.5):>10.1f}"
+                f"{percentile(latencies, 0.99):>12.1f}"
+                f"{statistics.fmean(latencies) * 1_000_000:>12.1f}"
+                f"{hot_calls:>11}"
+            )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,73 @@
+"""
+Benchmark the per-request overhead of the todo routes.
+
+Compares the regular routes against the ``TODO_FAST_PATH`` routes by calling
+the ASGI application directly, so no HTTP client or server cost is included.
+Run with ``python -m benchmarks.todo_routes``.
+"""
+
+import asyncio
+import time
+
+import typer
+from fastapi import FastAPI
+
+from app.models.todo import TodoCreate
+from app.services import todo
+from benchmarks.utils import build_app, call
+
+cli = typer.Typer(add_completion=False)
+
+
+async def time_requests(
+    app: FastAPI, method: str, path: str, requests: int, body: bytes = b""
+) -> float:
+    """Return the mean time per request in microseconds."""
+    for _ in range(min(requests, 100)):
+        await call(app, method, path, body)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app, method, path, body)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def run(requests: int, list_size: int) -> None:
+    """Run every scenario against both applications and print the results."""
+    # Start from an empty store. Replacing the singleton rather than clearing
+    # service.todos keeps the service's size counters consistent.
+    todo._todo_service = None
+    service = todo.get_todo_service()
+    todo_in = TodoCreate(title="Benchmark", description="x" * 200)
+    todo_id = service.create_todo(todo_in).id
+    for _ in range(list_size - 1):
+        service.create_todo(todo_in)
+    body = todo_in.model_dump_json().encode()
+
+    regular, fast = build_app(TODO_FAST_PATH="False"), build_app(TODO_FAST_PATH="True")
+    scenarios = [
+        ("GET /todos/{id}", "GET", f"/api/todos/{todo_id}", b""),
+        (f"GET /todos/ ({list_size} items)", "GET", "/api/todos/", b""),
+        ("PUT /todos/{id}", "PUT", f"/api/todos/{todo_id}", body),
+    ]
+
+    typer.echo(f"{'scenario':<28}{'regular us':>12}{'fast us':>12}{'speedup':>10}")
+    for name, method, path, payload in scenarios:
+        regular_us = await time_requests(regular, method, path, requests, payload)
+        fast_us = await time_requests(fast, method, path, requests, payload)
+        typer.echo(
+            f"{name:<28}{regular_us:>12.1f}{fast_us:>12.1f}"
+            f"{regular_us / fast_us:>9.2f}x"
+        )
+
+
+@cli.command()
+def main(
+    requests: int = typer.Option(5000, help="Requests per scenario."),
+    list_size: int = typer.Option(100, help="Number of todos in the store."),
+) -> None:
+    """Compare per-request overhead of the regular and fast-path todo routes."""
+    asyncio.run(run(requests, list_size))
+
+
+if __name__ == "__main__":
+    cli()
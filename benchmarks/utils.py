@@ -0,0 +1,74 @@
+"""Helpers shared by the benchmarks."""
+
+import asyncio
+import os
+from typing import Any
+
+from fastapi import FastAPI
+
+from app.core.config import get_settings
+from app.main import create_application
+
+Message = dict[str, Any]
+
+
+def build_app(**env: str) -> FastAPI:
+    """
+    Create the application with extra settings.
+
+    Settings are passed as environment variables, which are restored once the
+    application has been created.
+    """
+    saved = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+    get_settings.cache_clear()
+    try:
+        return create_application()
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        get_settings.cache_clear()
+
+
+async def call(
+    app: FastAPI,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> bytes:
+    """Send a single request through the ASGI app and return the response body."""
+    scope: Message = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            *(headers or []),
+        ],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+        # Writing to a socket lets other requests run, as it would in a server
+        await asyncio.sleep(0)
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
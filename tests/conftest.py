@@ -1,7 +1,13 @@
+from collections.abc import Callable
+
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.core.config import get_settings
+from app.main import app, create_application
+
+AppFactory = Callable[..., FastAPI]
 
 
 @pytest.fixture
@@ -13,3 +19,27 @@ def client() -> TestClient:
         TestClient: A test client for the FastAPI application
     """
     return TestClient(app)
+
+
+@pytest.fixture
+def app_factory(monkeypatch: pytest.MonkeyPatch) -> AppFactory:
+    """
+    Return a function that creates an application with extra settings.
+
+    Settings are passed as environment variables, which are restored when the
+    test finishes.
+
+    Returns:
+        AppFactory: Creates a FastAPI application from keyword settings
+    """
+
+    def factory(**env: str) -> FastAPI:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        get_settings.cache_clear()
+        try:
+            return create_application()
+        finally:
+            get_settings.cache_clear()
+
+    return factory
@@ -0,0 +1,138 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.services import tenant
+from tests.conftest import AppFactory
+
+
+class TestTenantsAPI:
+    """Integration tests for the multi-tenant todos API."""
+
+    @pytest.fixture(params=[False, True], ids=["regular", "fast-path"])
+    def tenant_client(
+        self,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+        app_factory: AppFactory,
+    ) -> TestClient:
+        """Return a client for a multi-tenant app with a fresh tenant registry."""
+        monkeypatch.setattr(tenant, "_tenant_registry", None)
+        application = app_factory(
+            MULTI_TENANT="True",
+            TENANT_MAX_ITEMS="2",
+            TENANT_MAX_PARTITIONS="3",
+            TODO_FAST_PATH=str(request.param),
+        )
+        return TestClient(application)
+
+    def test_header_tenants_are_isolated(self, tenant_client: TestClient) -> None:
+        """Test that todos created for one tenant are invisible to another."""
+        # Arrange
+        created = tenant_client.post(
+            "/api/todos/", json={"title": "Acme Todo"}, headers={"X-Tenant-ID": "acme"}
+        )
+        todo_id = created.json()["id"]
+
+        # Act
+        acme = tenant_client.get("/api/todos/", headers={"X-Tenant-ID": "acme"})
+        globex = tenant_client.get("/api/todos/", headers={"X-Tenant-ID": "globex"})
+        cross = tenant_client.get(
+            f"/api/todos/{todo_id}", headers={"X-Tenant-ID": "globex"}
+        )
+
+        # Assert
+        assert created.status_code == status.HTTP_201_CREATED
+        assert [todo["id"] for todo in acme.json()] == [todo_id]
+        assert globex.json() == []
+        assert cross.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_path_prefix_matches_header(self, tenant_client: TestClient) -> None:
+        """Test that the path prefix and the header select the same tenant."""
+        # Arrange
+        created = tenant_client.post(
+            "/api/tenants/acme/todos/", json={"title": "Acme Todo"}
+        )
+        todo_id = created.json()["id"]
+
+        # Act
+        by_path = tenant_client.get(f"/api/tenants/acme/todos/{todo_id}")
+        by_header = tenant_client.get(
+            f"/api/todos/{todo_id}", headers={"X-Tenant-ID": "acme"}
+        )
+        by_default = tenant_client.get(f"/api/todos/{todo_id}")
+
+        # Assert
+        assert by_path.status_code == status.HTTP_200_OK
+        assert by_header.json() == by_path.json()
+        assert by_default.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_quota_exceeded(self, tenant_client: TestClient) -> None:
+        """Test that a tenant over its item quota gets a 429 response."""
+        # Arrange
+        for _ in range(2):
+            tenant_client.post("/api/tenants/acme/todos/", json={"title": "Todo"})
+
+        # Act
+        response = tenant_client.post(
+            "/api/tenants/acme/todos/", json={"title": "Todo"}
+        )
+        other = tenant_client.post("/api/tenants/globex/todos/", json={"title": "Todo"})
+
+        # Assert
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.json() == {"detail": "Todo quota exceeded: at most 2 items"}
+        assert other.status_code == status.HTTP_201_CREATED
+
+    def test_tenant_limit_exceeded(self, tenant_client: TestClient) -> None:
+        """Test that new tenants beyond the limit are rejected, not evicting others."""
+        # Arrange
+        created = tenant_client.post("/api/tenants/t0/todos/", json={"title": "Todo"})
+        for tenant_id in ("t1", "t2"):
+            tenant_client.post(
+                f"/api/tenants/{tenant_id}/todos/", json={"title": "Todo"}
+            )
+
+        # Act
+        response = tenant_client.post("/api/tenants/t3/todos/", json={"title": "Todo"})
+        existing = tenant_client.get(f"/api/tenants/t0/todos/{created.json()['id']}")
+
+        # Assert
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert existing.status_code == status.HTTP_200_OK
+
+    def test_reads_do_not_create_partitions(self, tenant_client: TestClient) -> None:
+        """Test that reads for unknown tenants neither allocate nor use up slots."""
+        # Act
+        responses = [
+            tenant_client.get("/api/todos/", headers={"X-Tenant-ID": f"probe-{i}"})
+            for i in range(10)
+        ]
+        missing = tenant_client.get("/api/tenants/probe-0/todos/some-id")
+        created = tenant_client.post("/api/tenants/acme/todos/", json={"title": "Todo"})
+
+        # Assert
+        assert all(response.json() == [] for response in responses)
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+        assert created.status_code == status.HTTP_201_CREATED
+        assert list(tenant.get_tenant_registry().partitions) == ["acme"]
+
+    def test_invalid_tenant_rejected(self, tenant_client: TestClient) -> None:
+        """Test that malformed tenant IDs are rejected."""
+        # Act
+        response = tenant_client.get("/api/todos/", headers={"X-Tenant-ID": "a b"})
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_openapi_documents_tenant_prefix(self, tenant_client: TestClient) -> None:
+        """Test that the tenant path parameter appears in the OpenAPI schema."""
+        # Act
+        schema = tenant_client.get("/api/openapi.json").json()
+
+        # Assert
+        operation = schema["paths"]["/api/tenants/{tenant_id}/todos/{todo_id}"]["get"]
+        assert {param["name"] for param in operation["parameters"]} == {
+            "tenant_id",
+            "todo_id",
+        }
@@ -0,0 +1,124 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.api.routes.todos import LIST_CHUNK_SIZE
+from app.models.todo import TodoCreate, todo_response_list_adapter
+from app.services.todo import get_todo_service
+from tests.conftest import AppFactory
+
+
+class TestTodosFastPath:
+    """Tests that the fast-path todo routes match the regular routes exactly."""
+
+    @pytest.fixture
+    def fast_client(self, app_factory: AppFactory) -> TestClient:
+        """Return a test client for an application with the fast path enabled."""
+        return TestClient(app_factory(TODO_FAST_PATH="True"))
+
+    def test_openapi_schema_identical(
+        self, client: TestClient, fast_client: TestClient
+    ) -> None:
+        """Test that the fast path produces a byte-identical OpenAPI schema."""
+        # Act
+        regular = client.get("/api/openapi.json")
+        fast = fast_client.get("/api/openapi.json")
+
+        # Assert
+        assert fast.status_code == status.HTTP_200_OK
+        assert fast.content == regular.content
+
+    def test_create_todo(self, fast_client: TestClient) -> None:
+        """Test creating a todo through the fast path."""
+        # Arrange
+        todo_data = {"title": "Fast Todo", "description": "Ünïcode ✓", "done": False}
+
+        # Act
+        response = fast_client.post("/api/todos/", json=todo_data)
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data == {"id": data["id"], **todo_data}
+
+    def test_responses_byte_identical(
+        self, client: TestClient, fast_client: TestClient
+    ) -> None:
+        """Test that both paths return identical bytes and headers."""
+        # Arrange - Both applications share the TodoService singleton
+        todo_data = {
+            "title": 'Quotes " and \\ slashes',
+            "description": "Ünïcode ✓ \n\t\u0001   😀",
+            "done": True,
+        }
+        todo_id = client.post("/api/todos/", json=todo_data).json()["id"]
+
+        for path in (f"/api/todos/{todo_id}", "/api/todos/", "/api/todos/missing"):
+            # Act
+            regular = client.get(path)
+            fast = fast_client.get(path)
+
+            # Assert
+            assert fast.status_code == regular.status_code
+            assert fast.content == regular.content
+            assert fast.headers == regular.headers
+
+    def test_update_and_delete_todo(
+        self, client: TestClient, fast_client: TestClient
+    ) -> None:
+        """Test updating and deleting a todo through the fast path."""
+        # Arrange
+        todo_id = fast_client.post("/api/todos/", json={"title": "Original"}).json()[
+            "id"
+        ]
+        update_data = {"title": "Updated", "description": "", "done": True}
+
+        # Act
+        updated = fast_client.put(f"/api/todos/{todo_id}", json=update_data)
+        expected = client.get(f"/api/todos/{todo_id}")
+        deleted = fast_client.delete(f"/api/todos/{todo_id}")
+
+        # Assert
+        assert updated.status_code == status.HTTP_200_OK
+        assert updated.content == expected.content
+        assert deleted.status_code == status.HTTP_204_NO_CONTENT
+        assert deleted.content == b""
+        assert fast_client.get(f"/api/todos/{todo_id}").status_code == (
+            status.HTTP_404_NOT_FOUND
+        )
+
+    def test_invalid_todo_rejected(self, fast_client: TestClient) -> None:
+        """Test that request bodies are still validated on the fast path."""
+        # Act
+        response = fast_client.post("/api/todos/", json={"title": ""})
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_large_list_streamed_in_chunks(
+        self, client: TestClient, fast_client: TestClient
+    ) -> None:
+        """Test that lists longer than one chunk are streamed as one JSON array."""
+        # Arrange
+        service = get_todo_service()
+        created = [
+            service.create_todo(TodoCreate(title=f"Todo {i}", description="✓"))
+            for i in range(LIST_CHUNK_SIZE * 2 + 1)
+        ]
+        expected = todo_response_list_adapter.dump_json(service.get_todos())
+
+        try:
+            # Act
+            regular = client.get("/api/todos/")
+            fast = fast_client.get("/api/todos/")
+        finally:
+            for todo in created:
+                service.delete_todo(todo.id)
+
+        # Assert
+        assert regular.status_code == status.HTTP_200_OK
+        assert regular.headers["content-type"] == "application/json"
+        assert regular.content == expected
+        assert fast.content == expected
+        assert fast.headers == regular.headers
@@ -0,0 +1,22 @@
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+
+
+class TestSettings:
+    """Tests for the Settings class."""
+
+    def test_default_tenant_valid(self) -> None:
+        """Test that a valid default tenant is accepted."""
+        # Act
+        settings = Settings(DEFAULT_TENANT="acme-1")
+
+        # Assert
+        assert settings.DEFAULT_TENANT == "acme-1"
+
+    def test_default_tenant_invalid(self) -> None:
+        """Test that a default tenant that is not a valid tenant ID is rejected."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            Settings(DEFAULT_TENANT="not a tenant")
@@ -0,0 +1,206 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import fastapi.applications
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import get_settings
+from app.core.startup import export_openapi_schema
+from app.main import (
+    OPENAPI_FINGERPRINT_KEY,
+    create_application,
+    load_openapi_schema,
+    openapi_fingerprint,
+)
+from tests.conftest import AppFactory
+
+# Per-phase cold start budgets, in seconds, with roughly 3x headroom over a
+# typical run (import ~0.3, settings ~0.001, factory ~0.05). Serving the cached
+# schema takes ~0.5 ms, while generating it takes ~15 ms, so the first request
+# budget only holds when the cached schema is used.
+STARTUP_BUDGETS = {
+    "import_seconds": 1.0,
+    "settings_seconds": 0.05,
+    "factory_seconds": 0.25,
+    "first_request_seconds": 0.005,
+    "total_seconds": 1.2,
+}
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def run_python(*args: str, env: dict[str, str] | None = None) -> str:
+    """Run a fresh interpreter in the project root and return its stdout."""
+    result = subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+class TestStartup:
+    """Tests for the startup-optimized mode and startup tooling."""
+
+    @pytest.fixture
+    def schema_path(self, tmp_path: Path) -> Path:
+        """Export the OpenAPI schema to a temporary file."""
+        path = tmp_path / "openapi.json"
+        export_openapi_schema(path)
+        return path
+
+    def test_import_does_not_build_application(self) -> None:
+        """Test that importing app.main defers the routers and the app itself."""
+        # Act
+        output = run_python(
+            "-c",
+            "import sys, app.main; "
+            "print('app.api.routes.todos' in sys.modules, 'app' in vars(app.main))",
+        )
+
+        # Assert
+        assert output.split() == ["False", "False"]
+
+    def test_cached_schema_is_served(
+        self,
+        schema_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        app_factory: AppFactory,
+    ) -> None:
+        """Test that the exported schema is served instead of being generated."""
+        # Arrange - Mark the exported file so a regenerated schema is detectable
+        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        schema["info"]["title"] = "FROM CACHED FILE"
+        schema_path.write_text(json.dumps(schema), encoding="utf-8")
+        client = TestClient(app_factory(OPENAPI_SCHEMA_PATH=str(schema_path)))
+
+        def fail_get_openapi(**kwargs: object) -> None:
+            raise AssertionError("OpenAPI schema was regenerated")
+
+        monkeypatch.setattr(fastapi.applications, "get_openapi", fail_get_openapi)
+
+        # Act
+        response = client.get("/api/openapi.json")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["info"]["title"] == "FROM CACHED FILE"
+        assert OPENAPI_FINGERPRINT_KEY not in data
+
+    def test_cached_schema_matches_generated(
+        self, schema_path: Path, app_factory: AppFactory
+    ) -> None:
+        """Test that the exported schema is served byte-identically."""
+        # Arrange
+        expected = TestClient(create_application()).get("/api/openapi.json")
+        client = TestClient(app_factory(OPENAPI_SCHEMA_PATH=str(schema_path)))
+
+        # Act
+        response = client.get("/api/openapi.json")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == expected.content
+
+    def test_stale_schema_is_ignored(
+        self, schema_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a schema exported for another application is not loaded."""
+        # Act
+        schema = load_openapi_schema(str(schema_path), "other-fingerprint")
+
+        # Assert
+        assert schema is None
+        assert "does not match the application" in caplog.text
+
+    def test_fingerprint_changes_with_models(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that changing a model's constraints invalidates the schema."""
+        # Arrange - Fingerprint a copy of the application sources
+        app_dir = tmp_path / "app"
+        shutil.copytree(main.APP_DIR, app_dir)
+        monkeypatch.setattr(main, "APP_DIR", app_dir)
+        application = create_application()
+        settings = get_settings()
+        before = openapi_fingerprint(application, settings)
+        models = app_dir / "models" / "todo.py"
+
+        # Act
+        models.write_text(
+            models.read_text(encoding="utf-8").replace(
+                "max_length=100", "max_length=5"
+            ),
+            encoding="utf-8",
+        )
+        after = openapi_fingerprint(application, settings)
+
+        # Assert
+        assert after != before
+
+    @pytest.mark.parametrize(
+        "env",
+        [{"MULTI_TENANT": "True"}, {"API_PREFIX": "/v2"}, {"TODO_FAST_PATH": "True"}],
+    )
+    def test_schema_stale_when_settings_change(
+        self,
+        schema_path: Path,
+        app_factory: AppFactory,
+        env: dict[str, str],
+    ) -> None:
+        """Test that route-affecting settings invalidate the exported schema."""
+        # Arrange
+        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        schema["info"]["title"] = "FROM CACHED FILE"
+        schema_path.write_text(json.dumps(schema), encoding="utf-8")
+        client = TestClient(app_factory(OPENAPI_SCHEMA_PATH=str(schema_path), **env))
+        prefix = env.get("API_PREFIX", "/api")
+
+        # Act
+        response = client.get(f"{prefix}/openapi.json")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["info"]["title"] != "FROM CACHED FILE"
+
+    def test_missing_schema_is_ignored(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a missing schema file falls back to lazy generation."""
+        # Act
+        schema = load_openapi_schema(str(tmp_path / "missing.json"), "fingerprint")
+
+        # Assert
+        assert schema is None
+        assert "not found" in caplog.text
+
+    def test_startup_report_within_budget(self, schema_path: Path) -> None:
+        """Test that a cold start in startup-optimized mode stays within budget."""
+        # Arrange
+        env = {**os.environ, "OPENAPI_SCHEMA_PATH": str(schema_path)}
+
+        # Act
+        output = run_python(
+            "-m", "app.core.startup", "--startup-report", "--json", env=env
+        )
+        report = json.loads(output)
+
+        # Assert
+        assert set(report) == set(STARTUP_BUDGETS)
+        over_budget = {
+            phase: seconds
+            for phase, seconds in report.items()
+            if seconds > STARTUP_BUDGETS[phase]
+        }
+        assert over_budget == {}
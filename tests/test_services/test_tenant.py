@@ -0,0 +1,179 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.exceptions.todo_exceptions import TodoQuotaExceededError
+from app.models.todo import TodoCreate
+from app.services.tenant import TenantRegistry
+
+
+class FakeClock:
+    """Manually advanced clock for testing idle eviction."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTenantRegistry:
+    """Tests for the TenantRegistry class."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Return a clock starting at zero."""
+        return FakeClock()
+
+    def test_partitions_are_isolated(self) -> None:
+        """Test that each tenant gets its own storage."""
+        # Arrange
+        registry = TenantRegistry()
+
+        # Act
+        registry.get_service("acme").create_todo(TodoCreate(title="Acme Todo"))
+        registry.get_service("globex").create_todo(TodoCreate(title="Globex Todo"))
+
+        # Assert
+        assert registry.get_service("acme") is not registry.get_service("globex")
+        assert [t.title for t in registry.get_service("acme").get_todos()] == [
+            "Acme Todo"
+        ]
+        assert [t.title for t in registry.get_service("globex").get_todos()] == [
+            "Globex Todo"
+        ]
+
+    def test_quotas_apply_per_tenant(self) -> None:
+        """Test that one tenant reaching its quota does not affect another."""
+        # Arrange
+        registry = TenantRegistry(max_items=1)
+        registry.get_service("acme").create_todo(TodoCreate(title="Todo"))
+
+        # Act & Assert
+        with pytest.raises(TodoQuotaExceededError):
+            registry.get_service("acme").create_todo(TodoCreate(title="Todo"))
+        registry.get_service("globex").create_todo(TodoCreate(title="Todo"))
+
+    def test_lookup_without_create(self) -> None:
+        """Test that looking up an unknown tenant does not create a partition."""
+        # Arrange
+        registry = TenantRegistry()
+
+        # Act
+        service = registry.get_service("acme", create=False)
+
+        # Assert
+        assert service.get_todos() == []
+        assert list(registry.partitions) == []
+        with pytest.raises(TodoQuotaExceededError):
+            service.create_todo(TodoCreate(title="Todo"))
+
+    def test_rejects_new_tenants_over_limit(self) -> None:
+        """Test that new tenants are rejected instead of evicting active ones."""
+        # Arrange
+        registry = TenantRegistry(max_partitions=2)
+        registry.get_service("acme").create_todo(TodoCreate(title="Todo"))
+        registry.get_service("globex")
+
+        # Act & Assert
+        with pytest.raises(TodoQuotaExceededError):
+            registry.get_service("initech")
+        assert list(registry.partitions) == ["acme", "globex"]
+        assert len(registry.get_service("acme").get_todos()) == 1
+
+    def test_idle_partition_frees_slot(self, clock: FakeClock) -> None:
+        """Test that evicting an idle partition makes room for a new tenant."""
+        # Arrange
+        registry = TenantRegistry(idle_seconds=60, max_partitions=1, clock=clock)
+        registry.get_service("acme")
+
+        # Act
+        clock.now = 61
+        registry.get_service("globex")
+
+        # Assert
+        assert list(registry.partitions) == ["globex"]
+
+    def test_evicts_idle_partitions(self, clock: FakeClock) -> None:
+        """Test that empty partitions idle for too long are evicted."""
+        # Arrange
+        registry = TenantRegistry(idle_seconds=60, clock=clock)
+        registry.get_service("acme")
+        clock.now = 30
+        registry.get_service("globex")
+
+        # Act
+        clock.now = 61
+        registry.get_service("globex")
+
+        # Assert
+        assert list(registry.partitions) == ["globex"]
+
+    def test_idle_partition_with_todos_is_kept(self, clock: FakeClock) -> None:
+        """Test that idle partitions holding todos are not evicted by default."""
+        # Arrange
+        registry = TenantRegistry(idle_seconds=60, max_partitions=1, clock=clock)
+        registry.get_service("acme").create_todo(TodoCreate(title="Todo"))
+
+        # Act
+        clock.now = 61
+        with pytest.raises(TodoQuotaExceededError):
+            registry.get_service("globex")
+
+        # Assert
+        assert list(registry.partitions) == ["acme"]
+        assert [t.title for t in registry.get_service("acme").get_todos()] == ["Todo"]
+
+    def test_evict_nonempty_logs_discarded_todos(
+        self, clock: FakeClock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that evicting a partition holding todos logs a warning."""
+        # Arrange
+        registry = TenantRegistry(idle_seconds=60, evict_nonempty=True, clock=clock)
+        registry.get_service("acme").create_todo(TodoCreate(title="Todo"))
+
+        # Act
+        clock.now = 61
+        with caplog.at_level(logging.WARNING, logger="app.services.tenant"):
+            registry.get_service("globex")
+
+        # Assert
+        assert list(registry.partitions) == ["globex"]
+        assert "Evicting idle tenant acme, discarding 1 todos" in caplog.text
+
+    def test_recently_used_partition_is_kept(self, clock: FakeClock) -> None:
+        """Test that a partition accessed within the idle window is kept."""
+        # Arrange
+        registry = TenantRegistry(idle_seconds=60, clock=clock)
+        service = registry.get_service("acme")
+
+        # Act
+        clock.now = 50
+        registry.get_service("globex")
+        clock.now = 60
+
+        # Assert
+        assert registry.get_service("acme") is service
+        assert list(registry.partitions) == ["globex", "acme"]
+
+    def test_concurrent_access(self) -> None:
+        """Test that the registry stays consistent when used from many threads."""
+        # Arrange
+        registry = TenantRegistry(max_partitions=3, idle_seconds=0.0)
+        tenant_ids = [f"tenant-{i}" for i in range(10)]
+
+        def worker(offset: int) -> None:
+            for i in range(2000):
+                try:
+                    registry.get_service(tenant_ids[(i + offset) % len(tenant_ids)])
+                except TodoQuotaExceededError:
+                    pass
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+
+        # Assert
+        assert len(registry.partitions) <= 3
+        assert set(registry.partitions) == set(registry._last_access)
@@ -1,6 +1,9 @@
 import pytest
 
-from app.core.exceptions.todo_exceptions import TodoNotFoundError
+from app.core.exceptions.todo_exceptions import (
+    TodoNotFoundError,
+    TodoQuotaExceededError,
+)
 from app.models.todo import TodoCreate
 from app.services.todo import TodoService
 
@@ -115,3 +118,75 @@ class TestTodoService:
         # Act & Assert
         with pytest.raises(TodoNotFoundError):
             todo_service.delete_todo("nonexistent-id")
+
+    def test_byte_count_tracks_writes(self) -> None:
+        """Test that the byte counter follows creates, updates and deletes."""
+        # Arrange
+        todo_service = TodoService(max_bytes=10_000)
+        created_todo = todo_service.create_todo(TodoCreate(title="Short"))
+        created_size = todo_service.byte_count
+
+        # Act
+        updated_todo = todo_service.update_todo(
+            created_todo.id, TodoCreate(title="Short", description="Longer now")
+        )
+        updated_size = todo_service.byte_count
+        todo_service.delete_todo(created_todo.id)
+
+        # Assert
+        assert created_size == len(created_todo.model_dump_json().encode())
+        assert updated_size == len(updated_todo.model_dump_json().encode())
+        assert todo_service.byte_count == 0
+
+    def test_create_todo_over_item_quota(self) -> None:
+        """Test that creating a todo beyond the item quota is rejected."""
+        # Arrange
+        todo_service = TodoService(max_items=2)
+        first = todo_service.create_todo(TodoCreate(title="Todo 1"))
+        todo_service.create_todo(TodoCreate(title="Todo 2"))
+
+        # Act & Assert
+        with pytest.raises(TodoQuotaExceededError):
+            todo_service.create_todo(TodoCreate(title="Todo 3"))
+        todo_service.update_todo(first.id, TodoCreate(title="Updated"))
+        todo_service.delete_todo(first.id)
+        todo_service.create_todo(TodoCreate(title="Todo 3"))
+        assert len(todo_service.get_todos()) == 2
+
+    def test_write_over_byte_quota(self) -> None:
+        """Test that writes beyond the byte quota are rejected and not stored."""
+        # Arrange
+        todo_service = TodoService(max_bytes=200)
+        created_todo = todo_service.create_todo(TodoCreate(title="Small"))
+        byte_count = todo_service.byte_count
+
+        # Act & Assert
+        with pytest.raises(TodoQuotaExceededError):
+            todo_service.create_todo(TodoCreate(title="Big", description="x" * 200))
+        with pytest.raises(TodoQuotaExceededError):
+            todo_service.update_todo(
+                created_todo.id, TodoCreate(title="Big", description="x" * 200)
+            )
+        assert todo_service.byte_count == byte_count
+        assert todo_service.get_todo(created_todo.id).title == "Small"
+
+    def test_byte_quota_counts_utf8_bytes(self) -> None:
+        """Test that the byte quota counts encoded bytes, not characters."""
+        # Arrange
+        todo_service = TodoService(max_bytes=100)
+        todo_in = TodoCreate(title="é" * 30)
+
+        # Act & Assert
+        with pytest.raises(TodoQuotaExceededError):
+            todo_service.create_todo(todo_in)
+        assert todo_service.get_todos() == []
+
+    def test_byte_count_untracked_without_quota(
+        self, todo_service: TodoService
+    ) -> None:
+        """Test that sizes are not computed when there is no byte quota."""
+        # Act
+        todo_service.create_todo(TodoCreate(title="Test Todo"))
+
+        # Assert
+        assert todo_service.byte_count == 0
@@ -1,6 +1,9 @@
 import pytest
 
-from app.core.exceptions.todo_exceptions import TodoNotFoundError
+from app.core.exceptions.todo_exceptions import (
+    TodoNotFoundError,
+    TodoQuotaExceededError,
+)
 from app.models.todo import TodoCreate
 from app.services.todo import TodoService
 
@@ -48,3 +51,14 @@ class TestTodoServiceExceptions:
 
         assert "nonexistent-id" in str(exc_info.value)
         assert exc_info.value.todo_id == "nonexistent-id"
+
+    def test_create_todo_raises_exception_over_quota(self) -> None:
+        """Test that create_todo raises TodoQuotaExceededError over the quota."""
+        # Arrange
+        todo_service = TodoService(max_items=0)
+
+        # Act/Assert
+        with pytest.raises(TodoQuotaExceededError) as exc_info:
+            todo_service.create_todo(TodoCreate(title="Todo"))
+
+        assert exc_info.value.message == "Todo quota exceeded: at most 0 items"